@@ -12,23 +12,47 @@ Functions included:
 - read_metadata_filenames: Reads metadata filenames from a text file.
 - prepare_directory: Prepares or creates a directory for file storage or validation.
 - save_variable_to_csv: Saves CSV variables into separate files for further processing.
+- save_variable_chunks_to_csv: Saves CSV variables from a chunked read into separate files.
 - download_metadata: Downloads metadata from a URL and saves it to the appropriate directory.
 - validate_downloaded_metadata: Validates the downloaded metadata files.
 - validate_created_dataset: Validates the created dataset against metadata specifications.
 - package_and_encrypt_dataset: Packages and encrypts datasets that 
 successfully pass validation checks of Microdata tools."""
 
+import codecs
 import csv
+import hashlib
+import importlib.metadata
+import io
+import json
+import mmap
 import os
+import shutil
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from itertools import repeat
 from pathlib import Path
 from datetime import date
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from microdata_tools import validate_dataset, validate_metadata, package_dataset
 from termcolor import colored
 from prettytable import PrettyTable
 
+# Identifier and temporal columns that are not exported as separate variables
+COLUMNS_TO_SKIP = frozenset({"s_sidkrg", "start_time", "stop_time"})
+
+# Fingerprints of datasets that passed validation, kept in the input directory
+VALIDATION_CACHE_FILENAME = ".validation_cache.json"
+
 
 # Define a timing decorator
 def timed(func):
@@ -64,54 +88,242 @@ def check_csv_symmetry(file_path, delimiter=";", encoding="utf-8-sig"):
     Returns:
         None: Prints a message indicating any column count issues.
     """
-    with open(file_path, "r", encoding=encoding) as file:
-        lines = file.readlines()
-
-    header = lines[0].strip().split(delimiter)
-    header_length = len(header)
+    # Lines are counted as raw bytes to skip decoding; this assumes an
+    # ASCII-compatible encoding, where the delimiter is a single byte sequence
+    delimiter = delimiter.encode(codecs.lookup(encoding).name.removesuffix("-sig"))
+    with open(file_path, "rb", buffering=1 << 20) as file:
+        header_length = file.readline().count(delimiter) + 1
+        # Stream the remaining rows and count delimiters instead of splitting
+        issues = [
+            (i, column_count)
+            for i, line in enumerate(file, start=2)
+            if (column_count := line.count(delimiter) + 1) != header_length
+        ]
     print(f"Number of columns in the header: {header_length}")
 
-    all_rows_aligned = True
-    issues = []
-    for i, line in enumerate(lines, start=1):
-        columns = line.strip().split(delimiter)
-        if len(columns) != header_length:
-            all_rows_aligned = False
-            issues.append((i, len(columns)))
-
-    if all_rows_aligned:
+    if not issues:
         print("All rows have the same number of columns.")
     else:
-        print("The following rows have column count issues:")
-        for issue in issues:
-            print(f"Row {issue[0]} has {issue[1]} columns (Expected {header_length})")
+        # Build the report first and write it to stdout in a single call
+        messages = ["The following rows have column count issues:"]
+        messages.extend(
+            f"Row {row} has {column_count} columns (Expected {header_length})"
+            for row, column_count in issues
+        )
+        print("\n".join(messages))
 
     return None  # Explicitly return None to ensure consistent unpacking
 
 
-@timed
-def read_csv_file(input_csv_filename, delimiter=";", encoding="utf-8-sig"):
+def _arrow_csv_options(input_csv_filename, delimiter, encoding, usecols):
     """
-    Reads the input CSV file and returns a DataFrame.
+    Builds the pyarrow CSV options that read a file as strings.
+
+    pyarrow removes quotes before leading spaces can be trimmed, which would
+    lose spaces inside quoted fields, so files containing the quote character
+    are left to the pandas parsers. So are files with empty or duplicate
+    column names, which pandas renames and pyarrow cannot convert.
 
     Args:
         input_csv_filename (str): Path to the CSV file.
         delimiter (str): Delimiter used in the CSV file.
         encoding (str): Encoding of the CSV file.
+        usecols (list): Columns to parse, or None for all columns.
 
     Returns:
-        pd.DataFrame: The data as a DataFrame, or None if there's an error.
+        tuple: (read_options, parse_options, convert_options) for pyarrow.csv.
+
+    Raises:
+        pa.ArrowInvalid: If the file is not suitable for the pyarrow parser.
     """
+    with open(input_csv_filename, "r", encoding=encoding, newline="") as file:
+        header = next(csv.reader(file, delimiter=delimiter))
+    names = [name.lstrip(" ") for name in header]
+    if len(set(names)) != len(names):
+        raise pa.ArrowInvalid("Duplicate column names")
+    if not all(names):
+        raise pa.ArrowInvalid("Empty column names")
+
+    quote = '"'.encode(codecs.lookup(encoding).name.removesuffix("-sig"))
+    with open(input_csv_filename, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        if mapped.find(quote) != -1:
+            raise pa.ArrowInvalid("Quoted fields")
+
+    include_columns = header
+    if usecols is not None:
+        wanted_columns = frozenset(usecols)
+        include_columns = [
+            column for column, name in zip(header, names) if name in wanted_columns
+        ]
+
+    # pyarrow skips a UTF-8 byte order mark on its own
+    if codecs.lookup(encoding).name in ("utf-8", "utf-8-sig"):
+        encoding = "utf8"
+    return (
+        pa_csv.ReadOptions(encoding=encoding),
+        pa_csv.ParseOptions(delimiter=delimiter, quote_char=False),
+        pa_csv.ConvertOptions(
+            column_types={column: pa.string() for column in header},
+            include_columns=include_columns,
+        ),
+    )
+
+
+def _arrow_table_to_frame(table):
+    """
+    Converts a table read by pyarrow.csv to a DataFrame of strings.
+
+    Leading spaces are trimmed from values and column names, like pandas'
+    skipinitialspace.
+
+    Args:
+        table (pa.Table): Table with string columns.
+
+    Returns:
+        pd.DataFrame: The data as a DataFrame.
+    """
+    columns = [pc.utf8_ltrim(column, characters=" ") for column in table.columns]
+    names = [name.lstrip(" ") for name in table.column_names]
+    return pa.Table.from_arrays(columns, names=names).to_pandas()
+
+
+def _read_csv_with_arrow(input_csv_filename, delimiter, encoding, usecols):
+    """
+    Reads a CSV file with the pyarrow parser and returns a DataFrame of strings.
+
+    Every column is read as a string so values such as "007" are kept as
+    written, and leading spaces are trimmed like pandas' skipinitialspace.
+
+    Args:
+        input_csv_filename (str): Path to the CSV file.
+        delimiter (str): Delimiter used in the CSV file.
+        encoding (str): Encoding of the CSV file.
+        usecols (list): Columns to parse, or None for all columns.
+
+    Returns:
+        pd.DataFrame: The data as a DataFrame.
+
+    Raises:
+        pa.ArrowInvalid: If the file cannot be parsed by pyarrow.
+    """
+    read_options, parse_options, convert_options = _arrow_csv_options(
+        input_csv_filename, delimiter, encoding, usecols
+    )
+    # Memory-mapping lets Arrow parse straight from the page cache
+    with pa.memory_map(input_csv_filename) as source:
+        table = pa_csv.read_csv(
+            source,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+    return _arrow_table_to_frame(table)
+
+
+def _read_csv_with_pandas(
+    input_csv_filename, delimiter, encoding, usecols, chunksize=None
+):
+    """
+    Reads a CSV file with the pandas parsers and returns a DataFrame of strings.
+
+    The C parser is used first; the slower Python parser is only tried
+    when the C parser fails to tokenize the file. Chunked reads are parsed
+    lazily with the Python parser, since the chunked C parser drops extra
+    fields from a row that starts a chunk instead of rejecting it.
+
+    Args:
+        input_csv_filename (str): Path to the CSV file.
+        delimiter (str): Delimiter used in the CSV file.
+        encoding (str): Encoding of the CSV file.
+        usecols (list): Columns to parse, or None for all columns.
+        chunksize (int, optional): Number of rows per chunk.
+
+    Returns:
+        pd.DataFrame: The data as a DataFrame, or an iterator of DataFrames
+                      when chunksize is given.
+    """
+    read_options = {
+        "delimiter": delimiter,
+        "encoding": encoding,
+        "skipinitialspace": True,
+        "dtype": str,
+        "na_filter": False,
+    }
+    # usecols is applied after parsing: passed to pandas, it makes the
+    # parsers silently drop extra fields instead of rejecting the row
+    if chunksize is not None:
+        chunks = pd.read_csv(
+            input_csv_filename, engine="python", chunksize=chunksize, **read_options
+        )
+        return (_select_columns(chunk, usecols) for chunk in chunks)
     try:
         df = pd.read_csv(
-            input_csv_filename,
-            delimiter=delimiter,
-            encoding=encoding,
-            engine="python",
-            skipinitialspace=True,
-            dtype=str,
-            na_filter=False,
+            input_csv_filename, engine="c", low_memory=False, **read_options
         )
+    except pd.errors.ParserError:
+        df = pd.read_csv(input_csv_filename, engine="python", **read_options)
+    return _select_columns(df, usecols)
+
+
+def _select_columns(df, usecols):
+    """
+    Selects the wanted columns of a DataFrame, ignoring absent ones.
+
+    Args:
+        df (pd.DataFrame): The data as a DataFrame.
+        usecols (list): Columns to keep, or None for all columns.
+
+    Returns:
+        pd.DataFrame: The DataFrame with only the wanted columns.
+    """
+    if usecols is None:
+        return df
+    wanted_columns = frozenset(usecols)
+    return df[[column for column in df.columns if column in wanted_columns]]
+
+
+@timed
+def read_csv_file(
+    input_csv_filename,
+    delimiter=";",
+    encoding="utf-8-sig",
+    usecols=None,
+    chunksize=None,
+):
+    """
+    Reads the input CSV file and returns a DataFrame.
+
+    The pyarrow parser is used first. Files it rejects are read with the
+    pandas parsers, which accept the same input as before. When chunksize
+    is given, the file is instead read lazily with the pandas Python parser
+    so only one chunk is held in memory at a time; parse errors then surface
+    while iterating.
+
+    Args:
+        input_csv_filename (str): Path to the CSV file.
+        delimiter (str): Delimiter used in the CSV file.
+        encoding (str): Encoding of the CSV file.
+        usecols (list, optional): Columns to parse. Columns missing from the
+            file are ignored. All columns are parsed when not given.
+        chunksize (int, optional): Number of rows per chunk.
+
+    Returns:
+        pd.DataFrame: The data as a DataFrame, or an iterator of DataFrames
+                      when chunksize is given. None if there's an error.
+    """
+    try:
+        if chunksize is not None:
+            chunks = _read_csv_with_pandas(
+                input_csv_filename, delimiter, encoding, usecols, chunksize
+            )
+            print("CSV file opened for chunked reading.")
+            return chunks
+        try:
+            df = _read_csv_with_arrow(input_csv_filename, delimiter, encoding, usecols)
+        except pa.ArrowInvalid:
+            df = _read_csv_with_pandas(input_csv_filename, delimiter, encoding, usecols)
         print("CSV file read successfully.")
         return df
     except Exception as e:
@@ -130,25 +342,28 @@ def extract_metadata_filenames(input_csv, output_metadata_file, columns_to_skip)
         columns_to_skip (set): Set of columns to exclude.
 
     Returns:
-        None: Writes filenames in lowercase to the specified file.
+        list: The filenames written, in lowercase. Empty if an error occurred.
     """
     try:
         with open(input_csv, mode="r", encoding="utf-8-sig") as csv_file:
-            reader = csv.reader(csv_file, delimiter=";")
-            first_row = next(reader)
-
+            first_row = next(csv.reader(csv_file, delimiter=";"))
+        filenames = [
+            filename
+            for filename in (name.strip().lower() for name in first_row)
+            if filename and filename not in columns_to_skip
+        ]
+
+        # One row per name, with the csv module's line terminator
         with open(
             output_metadata_file, mode="w", newline="", encoding="utf-8"
         ) as metadata_file:
-            writer = csv.writer(metadata_file)
-            for filename in first_row:
-                if filename.strip().lower() not in columns_to_skip:
-                    writer.writerow([filename.strip().lower()])
+            metadata_file.write("".join(f"{filename}\r\n" for filename in filenames))
 
         print(f"Metadata filenames successfully written to {output_metadata_file}")
     except Exception as e:
         print(f"Error occurred while processing: {e}")
-    return None
+        return []
+    return filenames
 
 
 @timed
@@ -164,7 +379,12 @@ def read_metadata_filenames(metadata_filenames_file, encoding="utf-8-sig"):
         list: List of filenames in uppercase.
     """
     with open(metadata_filenames_file, "r", encoding=encoding) as file:
-        filenames = [line.strip().upper() for line in file.readlines() if line.strip()]
+        # One name per line; blank lines are skipped
+        filenames = [
+            name
+            for name in (line.strip() for line in file.read().upper().splitlines())
+            if name
+        ]
     return filenames
 
 
@@ -183,47 +403,275 @@ def prepare_directory(directory):
     return os.path.abspath(directory)
 
 
+def _to_arrow_strings(values):
+    """
+    Converts a column to an Arrow string array for the fast CSV writer.
+
+    Args:
+        values (np.ndarray): Values of a column, one per row.
+
+    Returns:
+        pa.LargeStringArray: The values, or None if they are not all strings
+                             or csv.writer would quote any of them.
+    """
+    # Only columns holding str values are converted; other types, bytes
+    # included, are formatted by csv.writer
+    try:
+        strings = pa.array(values)
+    except pa.ArrowException:
+        return None
+    if not (pa.types.is_string(strings.type) or pa.types.is_large_string(strings.type)):
+        return None
+    strings = strings.cast(pa.large_string())
+    if (
+        strings.null_count
+        or pc.any(pc.match_substring_regex(strings, '[;"\r\n]')).as_py()
+    ):
+        return None
+    return strings
+
+
+def _append_variable_rows(csvfile, unit_ids, unit_id_strings, values, today):
+    """
+    Appends rows of a single variable to its CSV file in the Microdata row layout.
+
+    When both columns convert to Arrow strings, the rows are joined with
+    pyarrow compute. Otherwise they are formatted with csv.writer. Both
+    paths produce the same bytes. A byte order mark is written before the
+    first row of an empty file.
+
+    Args:
+        csvfile (io.BufferedWriter): The CSV file, opened in binary mode.
+        unit_ids (np.ndarray): Unit identifiers, one per row.
+        unit_id_strings (pa.LargeStringArray): unit_ids as returned by
+            _to_arrow_strings, or None.
+        values (np.ndarray): Values of the variable, one per row.
+        today (str): Date written to the stop column.
+
+    Returns:
+        None: The rows are written to the file.
+    """
+    value_strings = None if unit_id_strings is None else _to_arrow_strings(values)
+    if value_strings is not None:
+        if not len(value_strings):
+            return
+        # unit_id;value;;today; with the csv.writer line terminator
+        lines = pc.binary_join_element_wise(
+            unit_id_strings,
+            value_strings,
+            pa.scalar(f";{today};\r\n", pa.large_string()),
+            pa.scalar(";", pa.large_string()),
+        )
+        _, offsets, data = lines.buffers()
+        start, end = np.frombuffer(offsets, dtype=np.int64)[
+            [lines.offset, lines.offset + len(lines)]
+        ]
+        rows = data[start:end]
+    else:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=";")
+        writer.writerows(zip(unit_ids, values, repeat(""), repeat(today), repeat("")))
+        rows = buffer.getvalue().encode("utf-8")
+        if not rows:
+            return
+
+    if not csvfile.tell():
+        csvfile.write(codecs.BOM_UTF8)
+    csvfile.write(rows)
+
+
+def _write_variable_csv(filepath, unit_ids, unit_id_strings, values, today):
+    """
+    Writes a single variable to its CSV file in the Microdata row layout.
+
+    The directory of the file must already exist.
+
+    Args:
+        filepath (str): Path of the CSV file to write.
+        unit_ids (np.ndarray): Unit identifiers, one per row.
+        unit_id_strings (pa.LargeStringArray): unit_ids as returned by
+            _to_arrow_strings, or None.
+        values (np.ndarray): Values of the variable, one per row.
+        today (str): Date written to the stop column.
+
+    Returns:
+        None: The CSV file is written to disk.
+    """
+    # A 1 MiB buffer keeps the number of write syscalls low for large outputs
+    with open(filepath, "wb", buffering=1 << 20) as csvfile:
+        _append_variable_rows(csvfile, unit_ids, unit_id_strings, values, today)
+
+
+def _prepare_variable_files(columns, metadata_filenames, base_directory):
+    """
+    Works out the CSV file of each variable and creates its directory.
+
+    Directories are created here so the writer threads only write files.
+
+    Args:
+        columns (pd.Index): Columns of the input data.
+        metadata_filenames (list): List of lowercase metadata filenames.
+        base_directory (str): Base directory for saving CSV files.
+
+    Returns:
+        list: (filename, filepath) pairs for the variables present in columns.
+    """
+    variable_files = []
+    warnings = []
+    for filename in metadata_filenames:
+        if filename in COLUMNS_TO_SKIP:
+            continue
+        if filename not in columns:
+            warnings.append(
+                f"Warning: Column '{filename}' not found in DataFrame. Skipping."
+            )
+            continue
+        dataset_name = filename.upper()
+        directory_name = os.path.join(base_directory, dataset_name)
+        os.makedirs(directory_name, exist_ok=True)
+        variable_files.append(
+            (filename, os.path.join(directory_name, f"{dataset_name}.csv"))
+        )
+    if warnings:
+        print("\n".join(warnings))
+    return variable_files
+
+
 @timed
 def save_variable_to_csv(df, metadata_filenames, number_of_rows, base_directory):
     """
     Saves each variable in the DataFrame as a separate CSV file.
 
+    The files are independent of each other and are written concurrently.
+
     Args:
         df (pd.DataFrame): The data as a DataFrame.
-        metadata_filenames (list): List of metadata filenames.
+        metadata_filenames (list): List of lowercase metadata filenames.
         number_of_rows (int): Number of rows in the DataFrame.
         base_directory (str): Base directory for saving CSV files.
 
     Returns:
         None: Each variable is saved as a CSV in its own subdirectory.
     """
-    for name_index, filename in enumerate(metadata_filenames):
-        filename = filename.lower()
-        metadata_filenames[name_index] = filename
+    # Shared columns are extracted once and reused for every variable. The
+    # contiguous copy only happens for frames built from 2-D row-major arrays.
+    unit_ids = np.ascontiguousarray(
+        df["s_sidkrg"].to_numpy(copy=False)[:number_of_rows]
+    )
+    unit_id_strings = _to_arrow_strings(unit_ids)
+    today = date.today().isoformat()
 
-        if filename not in df.columns:
-            print(f"Warning: Column '{filename}' not found in DataFrame. Skipping.")
-            continue
-        if filename not in ["s_sidkrg", "start_time", "stop_time"]:
-            filepath = os.path.join(
-                base_directory, filename.upper(), f"{filename.upper()}.csv"
+    tasks = [
+        (filepath, df[filename].to_numpy(copy=False)[:number_of_rows])
+        for filename, filepath in _prepare_variable_files(
+            df.columns, metadata_filenames, base_directory
+        )
+    ]
+
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(tasks)))) as executor:
+        futures = [
+            executor.submit(
+                _write_variable_csv, filepath, unit_ids, unit_id_strings, values, today
             )
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-            with open(filepath, "w", encoding="utf-8-sig") as csvfile:
-                writer = csv.writer(csvfile, delimiter=";")
-                for i in range(number_of_rows):
-                    row_data = [
-                        df["s_sidkrg"].values[i],
-                        df[filename].values[i],
-                        "",
-                        date.today(),
-                        "",
-                    ]
-                    writer.writerow(row_data)
+            for filepath, values in tasks
+        ]
+        for future in futures:
+            future.result()
     return None
 
 
+@timed
+def save_variable_chunks_to_csv(chunks, metadata_filenames, base_directory):
+    """
+    Saves each variable from a chunked read as a separate CSV file.
+
+    Each file is opened once and the rows of every chunk are appended to
+    it, so only one chunk of the input is held in memory at a time. The
+    files of a chunk are written concurrently.
+
+    Args:
+        chunks (iterable): DataFrames as returned by read_csv_file with a
+            chunksize.
+        metadata_filenames (list): List of lowercase metadata filenames.
+        base_directory (str): Base directory for saving CSV files.
+
+    Returns:
+        int: Number of rows saved, or None if the input could not be
+             parsed. Parse errors surface here, since chunks are read
+             lazily; other errors are raised.
+    """
+    today = date.today().isoformat()
+    number_of_rows = 0
+    csvfiles = None
+    with ExitStack() as stack, ThreadPoolExecutor(max_workers=32) as executor:
+        try:
+            for chunk in chunks:
+                if csvfiles is None:
+                    csvfiles = {
+                        filename: stack.enter_context(
+                            open(filepath, "wb", buffering=1 << 20)
+                        )
+                        for filename, filepath in _prepare_variable_files(
+                            chunk.columns, metadata_filenames, base_directory
+                        )
+                    }
+                unit_ids = chunk["s_sidkrg"].to_numpy(copy=False)
+                unit_id_strings = _to_arrow_strings(unit_ids)
+                futures = [
+                    executor.submit(
+                        _append_variable_rows,
+                        csvfile,
+                        unit_ids,
+                        unit_id_strings,
+                        chunk[filename].to_numpy(copy=False),
+                        today,
+                    )
+                    for filename, csvfile in csvfiles.items()
+                ]
+                for future in futures:
+                    future.result()
+                number_of_rows += len(chunk)
+        except (pd.errors.ParserError, UnicodeDecodeError) as e:
+            print(f"Error occurred: {e}")
+            return None
+    return number_of_rows
+
+
+def _download_metadata_file(
+    session, filename, url_without_metadata_parameter, base_directory
+):
+    """
+    Downloads a single metadata file and saves it in its dataset directory.
+
+    The dataset directory must already exist.
+
+    Args:
+        session (requests.Session): Session used for the request.
+        filename (str): Lowercase metadata filename.
+        url_without_metadata_parameter (str): URL to download metadata from.
+        base_directory (str): Directory where metadata will be saved.
+
+    Returns:
+        str: A message describing the outcome of the download.
+    """
+    dataset_name = filename.upper()
+    metadata_filename = dataset_name + ".json"
+    directory_name = os.path.join(base_directory, dataset_name)
+    url_with_metadata_parameter = url_without_metadata_parameter + filename
+
+    try:
+        with session.get(url_with_metadata_parameter, timeout=30, stream=True) as r:
+            r.raise_for_status()
+            # Let urllib3 undo any gzip/deflate transfer encoding while streaming
+            r.raw.decode_content = True
+            file_path = os.path.join(directory_name, metadata_filename)
+            with open(file_path, "wb") as f:
+                shutil.copyfileobj(r.raw, f, length=65536)
+        return f"Successfully retrieved {metadata_filename}"
+    except Exception as e:
+        return f"Failed to retrieve metadata: {e}"
+
+
 @timed
 def download_metadata(
     metadata_filenames, url_without_metadata_parameter, base_directory
@@ -231,39 +679,199 @@ def download_metadata(
     """
     Downloads metadata files from a URL and saves them in the specified directory.
 
+    The downloads share one pooled session and run concurrently.
+
     Args:
-        metadata_filenames (list): List of metadata filenames.
+        metadata_filenames (list): List of lowercase metadata filenames.
         url_without_metadata_parameter (str): URL to download metadata from.
         base_directory (str): Directory where metadata will be saved.
 
     Returns:
         None: Saves each metadata file as JSON in its respective directory.
     """
-    for filename in metadata_filenames:
-        filename = filename.lower()
-        if filename not in ["s_sidkrg", "start_time", "stop_time"]:
-            metadata_filename = filename.upper() + ".json"
-            directory_name = os.path.join(base_directory, filename.upper())
-            os.makedirs(directory_name, exist_ok=True)
-            url_with_metadata_parameter = url_without_metadata_parameter + filename
-
-            try:
-                r = requests.get(url_with_metadata_parameter, timeout=30)
-                r.raise_for_status()
-                file_path = os.path.join(directory_name, metadata_filename)
-                with open(file_path, "wb") as f:
-                    f.write(r.content)
-                print(f"Successfully retrieved {metadata_filename}")
-            except Exception as e:
-                print(f"Failed to retrieve metadata: {e}")
+    filenames = [
+        filename for filename in metadata_filenames if filename not in COLUMNS_TO_SKIP
+    ]
+    # Create every dataset directory up front, even for downloads that fail
+    for filename in filenames:
+        os.makedirs(os.path.join(base_directory, filename.upper()), exist_ok=True)
+
+    # Transient connection errors are retried with a short backoff
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    with requests.Session() as session:
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            messages = executor.map(
+                lambda filename: _download_metadata_file(
+                    session, filename, url_without_metadata_parameter, base_directory
+                ),
+                filenames,
+            )
+            for message in messages:
+                print(message)
     return None
 
 
+def _file_fingerprint(file_paths, previous=None):
+    """
+    Computes a fingerprint of the contents of one or more files.
+
+    The SHA-1 digest is only recomputed when the size or modification time
+    of a file differs from the previous fingerprint.
+
+    Args:
+        file_paths (list): Paths of the files to include, in order.
+        previous (dict): Fingerprint from an earlier run, if any.
+
+    Returns:
+        dict: {"stats": [[size, mtime_ns], ...], "sha1": hex digest},
+              or None if a file is missing.
+    """
+    try:
+        stats = [[st.st_size, st.st_mtime_ns] for st in map(os.stat, file_paths)]
+        if isinstance(previous, dict) and previous.get("stats") == stats:
+            return previous
+        digest = hashlib.sha1(usedforsecurity=False)
+        for file_path in file_paths:
+            with open(file_path, "rb") as file:
+                for chunk in iter(lambda: file.read(1 << 20), b""):
+                    digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return {"stats": stats, "sha1": digest.hexdigest()}
+
+
+def _load_validation_cache(base_directory):
+    """
+    Loads the fingerprints of datasets that passed validation in earlier runs.
+
+    The cache is discarded when it was written by another microdata_tools
+    version, since the validation rules may have changed.
+
+    Args:
+        base_directory (str): The directory where the dataset files are located.
+
+    Returns:
+        dict: Cache with a "metadata" and a "dataset" section, each mapping
+              dataset names to the fingerprint of the files that passed.
+    """
+    cache_path = os.path.join(base_directory, VALIDATION_CACHE_FILENAME)
+    tools_version = importlib.metadata.version("microdata-tools")
+    try:
+        with open(cache_path, "r", encoding="utf-8") as file:
+            cache = json.load(file)
+        if isinstance(cache, dict) and cache.get("microdata_tools") == tools_version:
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {"microdata_tools": tools_version, "metadata": {}, "dataset": {}}
+
+
+def _save_validation_cache(base_directory, cache):
+    """
+    Saves the validation cache in the specified directory.
+
+    The cache is written to a temporary file that then replaces the old
+    cache, so an interrupted run never leaves a truncated cache behind.
+
+    Args:
+        base_directory (str): The directory where the dataset files are located.
+        cache (dict): Cache as returned by _load_validation_cache.
+
+    Returns:
+        None: The cache is written to disk.
+    """
+    cache_path = os.path.join(base_directory, VALIDATION_CACHE_FILENAME)
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=base_directory, delete=False
+    ) as file:
+        json.dump(cache, file, indent=4)
+    os.replace(file.name, cache_path)
+
+
+def _validate_with_cache(
+    validator, cache_section, file_suffixes, metadata_filenames, base_directory
+):
+    """
+    Runs a microdata_tools validator, skipping datasets that have not changed.
+
+    A dataset is skipped when the files the validator reads have the same
+    contents as when it last passed. The remaining datasets are validated
+    concurrently, in sorted filename order.
+
+    Args:
+        validator (callable): validate_metadata or validate_dataset.
+        cache_section (str): Section of the validation cache to use.
+        file_suffixes (tuple): Suffixes of the dataset files the validator reads.
+        metadata_filenames (list): A list of metadata filenames to be validated.
+        base_directory (str): The directory where the dataset files are located.
+
+    Returns:
+        tuple: (valid, with_errors)
+               valid is a list of filenames that passed validation.
+               with_errors is a dictionary with filenames as keys and
+               error messages as values.
+    """
+    cache = _load_validation_cache(base_directory)
+    passed = cache[cache_section]
+
+    metadata_filenames = sorted(metadata_filenames)
+    fingerprints = {}
+    pending = []
+    for metadata_filename in metadata_filenames:
+        dataset_name = metadata_filename.upper()
+        previous = passed.get(dataset_name)
+        if not isinstance(previous, dict):
+            previous = {}
+        fingerprint = _file_fingerprint(
+            [
+                os.path.join(base_directory, dataset_name, dataset_name + suffix)
+                for suffix in file_suffixes
+            ],
+            previous,
+        )
+        fingerprints[metadata_filename] = fingerprint
+        if fingerprint is None or fingerprint["sha1"] != previous.get("sha1"):
+            pending.append(metadata_filename)
+
+    # Each dataset is validated independently, so the calls can overlap
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = executor.map(
+            lambda metadata_filename: validator(
+                metadata_filename.upper(), input_directory=base_directory
+            ),
+            pending,
+        )
+        validation_results = dict(zip(pending, results))
+
+    valid = []
+    with_errors = {}
+    for metadata_filename in metadata_filenames:
+        validation_errors = validation_results.get(metadata_filename)
+        if not validation_errors:
+            valid.append(metadata_filename)
+            passed[metadata_filename.upper()] = fingerprints[metadata_filename]
+        else:
+            with_errors[metadata_filename] = validation_errors
+            passed.pop(metadata_filename.upper(), None)
+
+    _save_validation_cache(base_directory, cache)
+    return valid, with_errors
+
+
 @timed
 def validate_downloaded_metadata(metadata_filenames, base_directory):
     """
     Validates the downloaded metadata files against the specified directory.
 
+    Metadata files that passed in an earlier run and are unchanged since
+    are not validated again.
+
     Args:
         metadata_filenames (list): A list of metadata filenames to be validated.
         base_directory (str): The directory where the metadata files are located.
@@ -274,18 +882,9 @@ def validate_downloaded_metadata(metadata_filenames, base_directory):
                metadata_with_errors is a dictionary with filenames as 
                keys and error messages as values.
     """
-    valid_metadata = []
-    metadata_with_errors = {}
-
-    for metadata_filename in metadata_filenames:
-        validation_errors = validate_metadata(
-            metadata_filename.upper(), input_directory=base_directory
-        )
-        if not validation_errors:
-            valid_metadata.append(metadata_filename)
-        else:
-            metadata_with_errors[metadata_filename] = validation_errors
-
+    valid_metadata, metadata_with_errors = _validate_with_cache(
+        validate_metadata, "metadata", (".json",), metadata_filenames, base_directory
+    )
     return valid_metadata, metadata_with_errors
 
 
@@ -294,6 +893,9 @@ def validate_created_dataset(metadata_filenames, base_directory):
     """
     Validates the created dataset files against the specified directory.
 
+    Datasets that passed in an earlier run and whose CSV and JSON files are
+    unchanged since are not validated again.
+
     Args:
         metadata_filenames (list): A list of metadata filenames whose
         corresponding datasets need validation.
@@ -304,19 +906,45 @@ def validate_created_dataset(metadata_filenames, base_directory):
                valid_datasets is a list of datasets that passed validation.
                datasets_with_errors is a dictionary with filenames as keys and error messages as values.
     """
-    valid_datasets = []
-    datasets_with_errors = {}
+    valid_datasets, datasets_with_errors = _validate_with_cache(
+        validate_dataset,
+        "dataset",
+        (".csv", ".json"),
+        metadata_filenames,
+        base_directory,
+    )
+    return valid_datasets, datasets_with_errors
 
-    for metadata_filename in metadata_filenames:
-        validation_errors = validate_dataset(
-            metadata_filename.upper(), input_directory=base_directory
-        )
-        if not validation_errors:
-            valid_datasets.append(metadata_filename)
-        else:
-            datasets_with_errors[metadata_filename] = validation_errors
 
-    return valid_datasets, datasets_with_errors
+def _package_one_dataset(
+    metadata_filename, rsa_keys_dir, base_directory, output_directory
+):
+    """
+    Packages and encrypts a single dataset.
+
+    Args:
+        metadata_filename (str): Metadata filename of the dataset.
+        rsa_keys_dir (Path): Directory containing the RSA public/private keys.
+        base_directory (Path): Directory where the datasets are located.
+        output_directory (Path): Base directory where packaged datasets will be saved.
+
+    Returns:
+        str: The error message, or None if the dataset was packaged.
+    """
+    dataset_name = metadata_filename.upper()
+    dataset_dir = base_directory / dataset_name
+    output_dir = output_directory / dataset_name
+
+    try:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        package_dataset(
+            rsa_keys_dir=rsa_keys_dir,
+            dataset_dir=dataset_dir,
+            output_dir=output_dir,
+        )
+    except Exception as e:
+        return str(e)
+    return None
 
 
 @timed
@@ -326,11 +954,15 @@ def package_and_encrypt_dataset(
     """
     Packages and encrypts datasets after they have been validated.
 
+    Each dataset is packaged in its own directories, so a few datasets are
+    packaged concurrently. Encryption holds several copies of a large chunk
+    of the dataset in memory, so the number of workers is kept small.
+
     Args:
         metadata_filenames (list): A list of metadata filenames to be packaged and encrypted.
         rsa_keys_dir (Path): Directory containing the RSA public/private keys.
-        base_directory (str): Directory where the datasets are located.
-        output_directory (str): Base directory where packaged datasets will be saved.
+        base_directory (str or Path): Directory where the datasets are located.
+        output_directory (str or Path): Base directory where packaged datasets will be saved.
 
     Returns:
         tuple: (successful_packages, failed_packages)
@@ -339,23 +971,43 @@ def package_and_encrypt_dataset(
     """
     successful_packages = []
     failed_packages = {}
+    # package_dataset takes Paths, so they are built as Paths from the start
+    base_directory = Path(base_directory)
+    output_directory = Path(output_directory)
+
+    # Every worker can hold several copies of a 250 MB chunk while encrypting,
+    # so peak memory grows with the number of workers
+    with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as executor:
+        errors = executor.map(
+            lambda metadata_filename: _package_one_dataset(
+                metadata_filename, rsa_keys_dir, base_directory, output_directory
+            ),
+            metadata_filenames,
+        )
+        for metadata_filename, error in zip(metadata_filenames, errors):
+            if error is None:
+                successful_packages.append(metadata_filename)
+            else:
+                failed_packages[metadata_filename] = error
 
-    for metadata_filename in metadata_filenames:
-        dataset_dir = os.path.join(base_directory, metadata_filename.upper())
-        output_dir = os.path.join(output_directory, metadata_filename.upper())
+    return successful_packages, failed_packages
 
-        try:
-            os.makedirs(output_dir, exist_ok=True)
-            package_dataset(
-                rsa_keys_dir=rsa_keys_dir,
-                dataset_dir=Path(dataset_dir),
-                output_dir=Path(output_dir),
-            )
-            successful_packages.append(metadata_filename)
-        except Exception as e:
-            failed_packages[metadata_filename] = str(e)
 
-    return successful_packages, failed_packages
+def _stop_on_unreadable_csv(input_csv_filename, timings):
+    """
+    Reports why the input CSV file could not be read.
+
+    Args:
+        input_csv_filename (str): Path to the input CSV file.
+        timings (list): Timing records to append the symmetry check to.
+
+    Returns:
+        None: The column count issues and a stop message are printed.
+    """
+    # The row-by-row scan only runs to explain why the parser failed
+    _, duration = check_csv_symmetry(input_csv_filename)
+    timings.append(("Check CSV Symmetry", duration))
+    print(colored("Stopping: the input CSV file could not be read.", "red"))
 
 
 def main():
@@ -369,22 +1021,44 @@ def main():
     output_directory = os.getenv("OUTPUT_DIR")
     metadata_filenames_file = "Microdata_metadata_variables.csv"
     url_without_metadata_parameter = os.getenv("URL_WITHOUT_METADATA_PARAMETER")
-    columns_to_skip = {"s_sidkrg", "start_time", "stop_time"}
+    # Optional: stream the input in chunks of this many rows to bound memory
+    chunksize = os.getenv("INPUT_CSV_CHUNKSIZE") or None
+    columns_to_skip = COLUMNS_TO_SKIP
 
-    # Run each function and store its result and timing
-    _, duration = extract_metadata_filenames(
+    if chunksize is not None:
+        try:
+            chunksize = int(chunksize)
+        except ValueError:
+            chunksize = 0
+        if chunksize < 1:
+            message = "Stopping: INPUT_CSV_CHUNKSIZE must be a positive integer."
+            print(colored(message, "red"))
+            return
+
+    # Run each function and store its result and timing. The filenames are
+    # taken from the header directly rather than read back from the file.
+    metadata_filenames, duration = extract_metadata_filenames(
         input_csv_filename, metadata_filenames_file, columns_to_skip
     )
     timings.append(("Extract Metadata Filenames", duration))
 
-    _, duration = check_csv_symmetry(input_csv_filename)
-    timings.append(("Check CSV Symmetry", duration))
-
-    df, duration = read_csv_file(input_csv_filename)
+    # Canonical lowercase names, deduplicated, used by every later step
+    metadata_filenames = [
+        filename
+        for filename in dict.fromkeys(name.lower() for name in metadata_filenames)
+        if filename and filename not in columns_to_skip
+    ]
+
+    df, duration = read_csv_file(
+        input_csv_filename,
+        usecols=["s_sidkrg", *metadata_filenames],
+        chunksize=chunksize,
+    )
     timings.append(("Read CSV File", duration))
 
-    metadata_filenames, duration = read_metadata_filenames(metadata_filenames_file)
-    timings.append(("Read Metadata Filenames", duration))
+    if df is None:
+        _stop_on_unreadable_csv(input_csv_filename, timings)
+        return
 
     input_directory_path, duration = prepare_directory(base_directory)
     timings.append(("Prepare Input Directory", duration))
@@ -392,10 +1066,20 @@ def main():
     output_directory_path, duration = prepare_directory(output_directory)
     timings.append(("Prepare Output Directory", duration))
 
-    _, duration = save_variable_to_csv(
-        df, metadata_filenames, df.shape[0], input_directory_path
-    )
-    timings.append(("Save Variable to CSV", duration))
+    if chunksize is None:
+        _, duration = save_variable_to_csv(
+            df, metadata_filenames, df.shape[0], input_directory_path
+        )
+        timings.append(("Save Variable to CSV", duration))
+    else:
+        # df holds the chunk iterator; parsing happens while the files are saved
+        number_of_rows, duration = save_variable_chunks_to_csv(
+            df, metadata_filenames, input_directory_path
+        )
+        timings.append(("Save Variable to CSV", duration))
+        if number_of_rows is None:
+            _stop_on_unreadable_csv(input_csv_filename, timings)
+            return
 
     _, duration = download_metadata(
         metadata_filenames, url_without_metadata_parameter, input_directory_path